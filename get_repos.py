@@ -1,8 +1,13 @@
 import pprint
+import hashlib
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
+import math
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from dotenv import load_dotenv, find_dotenv
 from typing import List, Dict, Any
 import os
@@ -20,89 +25,181 @@ if GITHUB_TOKEN is None:
 BASE_URL: str = "https://api.github.com/search/repositories"
 QUERY: str = "language:papyrus+skyrim+in:name,description"
 PER_PAGE: int = 100
-MAX_RETRIES: int = 5
+MAX_RETRIES: int = 8
+REQUEST_TIMEOUT: float = 30
+MAX_PAGES: int = 1000 // PER_PAGE
+MAX_WORKERS: int = 4
+CACHE_DIR: str = "cache"
+ETAG_CACHE_FILE: str = ".etag_cache.json"
+# Output is machine-read by the license scripts, so only indent it on request
+PRETTY: bool = os.getenv("PRETTY") == "1"
+# Dumping whole search responses is slow and noisy, so only do it on request
+DEBUG: bool = os.getenv("PAPYRUSPAL_DEBUG") == "1"
 HEADERS: Dict[str, str] = {
     "Accept": "application/vnd.github+json",
     "Authorization": f"Bearer {GITHUB_TOKEN}",
 }
 
+# Every request goes to api.github.com, so share one pooled connection
+# instead of paying a fresh TCP+TLS handshake for each page. The pool is sized
+# to the fetch workers so concurrent pages never discard connections.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS, max_retries=0),
+)
+SESSION.headers.update(HEADERS)
+
+
+def load_etag_cache() -> Dict[str, str]:
+    if not os.path.exists(ETAG_CACHE_FILE):
+        return {}
+    with open(ETAG_CACHE_FILE, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def save_etag_cache(etags: Dict[str, str]) -> None:
+    # Write to a temp file first so an interrupted run can't corrupt the cache
+    temp_file: str = f"{ETAG_CACHE_FILE}.tmp"
+    with open(temp_file, "wb") as f:
+        f.write(orjson.dumps(etags, option=orjson.OPT_INDENT_2))
+    os.replace(temp_file, ETAG_CACHE_FILE)
+
+
+def cached_body_path(full_url: str) -> str:
+    url_hash: str = hashlib.sha1(full_url.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{url_hash}.json")
+
+
+# ETag of the last successful response for each page URL, so unchanged pages
+# come back as an empty 304 instead of the full search payload
+ETAG_CACHE: Dict[str, str] = load_etag_cache()
+
+
+def backoff_seconds(response: requests.Response, attempt: int) -> float:
+    jitter: float = random.uniform(0, 1)
+
+    # Secondary rate limits tell us exactly how long to wait
+    retry_after: str | None = response.headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return int(retry_after) + jitter
+
+    # Primary rate limit exhausted: wait until the window resets
+    remaining: str | None = response.headers.get("X-RateLimit-Remaining")
+    reset: str | None = response.headers.get("X-RateLimit-Reset")
+    if remaining == "0" and reset is not None and reset.isdigit():
+        return max(0.0, int(reset) - time.time()) + jitter
+
+    # No guidance from GitHub, so fall back to jittered exponential backoff
+    return (2**attempt) + jitter
+
 
 def fetch_with_backoff(base_url: str, page: int) -> Dict[str, Any]:
     attempt: int = 0
 
-    # Build raw query manually
-    q: str = "language:papyrus+skyrim+in:name,description"
+    # Build raw query manually (requests would percent-encode the search syntax)
     other_params: Dict[str, Any] = {
         "per_page": PER_PAGE,
         "page": page,
         "sort": "stars",
         "order": "desc",
     }
-    query_string: str = f"q={q}&{urlencode(other_params)}"
+    query_string: str = f"q={QUERY}&{urlencode(other_params)}"
     full_url: str = f"{base_url}?{query_string}"
 
     print(f">>> Fetching: {full_url}")
 
+    body_path: str = cached_body_path(full_url)
+    conditional_headers: Dict[str, str] = {}
+    etag = ETAG_CACHE.get(full_url)
+    if etag and os.path.exists(body_path):
+        conditional_headers["If-None-Match"] = etag
+
+    # Prepared once per page; retries just re-send it
+    prepared = SESSION.prepare_request(
+        requests.Request("GET", full_url, headers=conditional_headers)
+    )
+
     while attempt < MAX_RETRIES:
-        response = requests.get(full_url, headers=HEADERS)
+        response = SESSION.send(prepared, timeout=REQUEST_TIMEOUT)
         print(f"Status code: {response.status_code}")
 
+        if response.status_code == 304:
+            print(f"Not modified, using cached response: {body_path}")
+            with open(body_path, "rb") as f:
+                return orjson.loads(f.read())
+
         if response.status_code == 200:
-            json_data = response.json()
-            pprint.pprint(json_data)
+            json_data = orjson.loads(response.content)
+            if DEBUG:
+                pprint.pprint(json_data)
+            etag = response.headers.get("ETag")
+            if etag:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(body_path, "wb") as f:
+                    f.write(response.content)
+                ETAG_CACHE[full_url] = etag
             return json_data
 
-        try:
-            print("Response JSON:", response.json())
-        except Exception:
-            print("Failed to decode JSON response")
+        if DEBUG:
+            print("Response body:", response.text)
+        else:
+            print("Response body:", response.text[:500])
 
-        if response.status_code == 403:
+        if response.status_code in (403, 429):
             print("Rate limit or abuse detection triggered. Backing off...")
         else:
             print(f"Unexpected status code: {response.status_code}. Retrying...")
 
-        sleep_time: float = (2**attempt) + random.uniform(0, 1)
+        sleep_time: float = backoff_seconds(response, attempt)
+        print(f"Sleeping for {sleep_time:.1f}s")
         time.sleep(sleep_time)
         attempt += 1
 
     raise Exception(f"Failed after {MAX_RETRIES} retries")
 
 
+def summarize_repos(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "html_url": repo["html_url"],
+            "description": repo.get("description", ""),
+            "license": repo.get("license") or None,
+        }
+        for repo in items
+    ]
+
+
 def fetch_all_repos() -> List[Dict[str, Any]]:
-    all_repos: List[Dict[str, str | None | Dict[str, str]]] = []
-    page: int = 1
-
-    while True:
-        print(f"Fetching page {page}...")
-        data: Dict[str, Any] = fetch_with_backoff(BASE_URL, page)
-        items = data.get("items", [])
-        if not items:
-            break
-
-        for repo in items:
-            all_repos.append(
-                {
-                    "html_url": repo["html_url"],
-                    "description": repo.get("description", ""),
-                    "license": repo.get("license") or None,
-                }
-            )
-
-        if len(items) < PER_PAGE:
-            break
-
-        page += 1
+    print("Fetching page 1...")
+    first_page: Dict[str, Any] = fetch_with_backoff(BASE_URL, 1)
+    all_repos = summarize_repos(first_page.get("items", []))
+
+    # The first page tells us how many pages there are, so the rest can be
+    # fetched concurrently (GitHub search never returns more than 1000 results)
+    total_count: int = first_page.get("total_count", 0)
+    page_count: int = min(MAX_PAGES, math.ceil(total_count / PER_PAGE))
+    if page_count < 2:
+        return all_repos
+
+    print(f"Fetching pages 2..{page_count} with {MAX_WORKERS} workers...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pages = executor.map(
+            partial(fetch_with_backoff, BASE_URL), range(2, page_count + 1)
+        )
+        for data in pages:
+            all_repos.extend(summarize_repos(data.get("items", [])))
 
     return all_repos
 
 
-def save_to_json(data: List[Dict[str, str]], filename: str) -> None:
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def save_to_json(data: List[Dict[str, Any]], filename: str) -> None:
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY else None))
 
 
 if __name__ == "__main__":
     repos = fetch_all_repos()
+    save_etag_cache(ETAG_CACHE)
     save_to_json(repos, "skyrim_papyrus_repos.json")
     print(f"Saved {len(repos)} repos to skyrim_papyrus_repos.json")
@@ -1,67 +1,30 @@
 import json
+import orjson
 import sys
 import io
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from licensing import OVERRIDES_BY_URL, classify_license
+
 # Force stdout to UTF-8 so emojis and symbols don't crash Windows consoles
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
 
 LICENSE_FILE: str = "skyrim_papyrus_repos.json"
 
 
-def classify_license(license_info: Optional[Dict[str, Any]]) -> str:
-    if license_info is None:
-        return "NONE"
-
-    spdx_id: Optional[str] = license_info.get("spdx_id")
-    if spdx_id is None or spdx_id.upper() == "NOASSERTION":
-        return "CUSTOM"
-
-    if spdx_id.upper() in {
-        "MIT",
-        "APACHE-2.0",
-        "WTFPL",
-        "BSD-2-CLAUSE",
-        "BSD-3-CLAUSE",
-        "0BSD",
-    }:
-        return "PERMISSIVE"
-
-    if spdx_id.upper() in {"GPL-3.0", "LGPL-3.0", "EPL-2.0"}:
-        return "COPYLEFT"
-
-    return license_info.get("name", "UNKNOWN")
-
-
 def main() -> None:
-    with open(LICENSE_FILE, "r", encoding="utf-8") as f:
-        repos: List[Dict[str, Any]] = json.load(f)
+    repos: List[Dict[str, Any]] = orjson.loads(Path(LICENSE_FILE).read_bytes())
 
     count_of_permissive = 0
     for repo in repos:
-        url: str = repo.get("html_url", "")
+        url: str = repo["html_url"]
         description: str = (repo.get("description") or "").strip()
         license_info: Optional[Dict[str, Any]] = repo.get("license")
 
-        license_type: str = classify_license(license_info)
-
-        # Override a few of them...
-        overrides_by_url: Dict[str, str] = {
-            "https://github.com/nbits-ssl/EcchinaArmorBreak": "PERMISSIVE",  # MIT
-            "https://github.com/nbits-ssl/ItsNotYourArmor": "PERMISSIVE",  # MIT
-            "https://github.com/nbits-ssl/SexLabYACR4N": "PERMISSIVE",  # MIT
-            "https://github.com/phalanx/Children-of-Lilith": "PERMISSIVE",  # MIT
-            "https://github.com/slacksystem/Immersive-Pickup-Only": "NON-COMMERCIAL",
-            "https://github.com/alexstrout/SkyrimSE": "NON-COMMERCIAL",
-            "https://github.com/CPULL/Skyrim-Pole-Dances-Framework": "NON-COMMERCIAL",
-            "https://github.com/alexstrout/SkyrimClassic": "NON-COMMERCIAL",
-            "https://github.com/ceejbot/firestarter": "COPYLEFT",
-            "https://github.com/nbits-ssl/SexLabYACR": "PERMISSIVE",
-        }
-
-        # override the license_type of repo is in the overrides_by_url
-        if url in overrides_by_url:
-            license_type = overrides_by_url[url]
+        # Manual overrides win, so only classify repos that don't have one
+        license_type: str = OVERRIDES_BY_URL.get(url) or classify_license(license_info)
 
         if license_type not in {"NONE", "GPL 3.0", "NON-COMMERCIAL"}:
 
@@ -0,0 +1,39 @@
+from typing import Any, Dict, FrozenSet, Optional
+
+# Manually reviewed licenses for repos whose GitHub license metadata is missing
+# or wrong
+OVERRIDES_BY_URL: Dict[str, str] = {
+    "https://github.com/nbits-ssl/EcchinaArmorBreak": "PERMISSIVE",  # MIT
+    "https://github.com/nbits-ssl/ItsNotYourArmor": "PERMISSIVE",  # MIT
+    "https://github.com/nbits-ssl/SexLabYACR4N": "PERMISSIVE",  # MIT
+    "https://github.com/phalanx/Children-of-Lilith": "PERMISSIVE",  # MIT
+    "https://github.com/slacksystem/Immersive-Pickup-Only": "NON-COMMERCIAL",
+    "https://github.com/alexstrout/SkyrimSE": "NON-COMMERCIAL",
+    "https://github.com/CPULL/Skyrim-Pole-Dances-Framework": "NON-COMMERCIAL",
+    "https://github.com/alexstrout/SkyrimClassic": "NON-COMMERCIAL",
+    "https://github.com/ceejbot/firestarter": "COPYLEFT",
+    "https://github.com/nbits-ssl/SexLabYACR": "PERMISSIVE",
+}
+
+PERMISSIVE_SPDX: FrozenSet[str] = frozenset(
+    {"MIT", "APACHE-2.0", "WTFPL", "BSD-2-CLAUSE", "BSD-3-CLAUSE", "0BSD"}
+)
+COPYLEFT_SPDX: FrozenSet[str] = frozenset({"GPL-3.0", "LGPL-3.0", "EPL-2.0"})
+
+# Every known (uppercased) SPDX id mapped straight to its license category
+SPDX_CLASS: Dict[str, str] = {
+    **{spdx_id: "PERMISSIVE" for spdx_id in PERMISSIVE_SPDX},
+    **{spdx_id: "COPYLEFT" for spdx_id in COPYLEFT_SPDX},
+    "NOASSERTION": "CUSTOM",
+}
+
+
+def classify_license(license_info: Optional[Dict[str, Any]]) -> str:
+    if license_info is None:
+        return "NONE"
+
+    spdx_id: Optional[str] = license_info.get("spdx_id")
+    if spdx_id is None:
+        return "CUSTOM"
+
+    return SPDX_CLASS.get(spdx_id.upper()) or license_info.get("name", "UNKNOWN")
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from re import Match
 
 import sass
-from PySide6.QtCore import QFileSystemWatcher
+from PySide6.QtCore import QFileSystemWatcher, QTimer
 from PySide6.QtWidgets import QApplication
 
 from qt_helpers.files import write_file
@@ -17,11 +17,13 @@ class StylesheetWatcher:
     out_qss_path: str
     _qss_watcher: QFileSystemWatcher = QFileSystemWatcher()
     _main_scss_folder_path: str = ""
+    _rebuild_pending: bool = False
+    _last_qss: str = ""
 
     def __post_init__(self):
         self._main_scss_folder_path = os.path.dirname(self.main_scss_path)
-        self._qss_watcher.fileChanged.connect(self._on_file_change)
-        self._qss_watcher.directoryChanged.connect(self._on_file_change)
+        self._qss_watcher.fileChanged.connect(self._schedule_rebuild)
+        self._qss_watcher.directoryChanged.connect(self._schedule_rebuild)
         self._update_watched_files()
         self._on_file_change()
 
@@ -41,10 +43,27 @@ class StylesheetWatcher:
             if os.path.isfile(full_path):
                 self._qss_watcher.addPath(full_path)
 
+    def _schedule_rebuild(self):
+        # A single save can emit several fileChanged/directoryChanged signals,
+        # so only rebuild once per event loop turn
+        if self._rebuild_pending:
+            return
+        self._rebuild_pending = True
+        QTimer.singleShot(0, self._run_pending_rebuild)
+
+    def _run_pending_rebuild(self):
+        self._rebuild_pending = False
+        self._on_file_change()
+
     def _on_file_change(self):
         print(f"Rebuilding {self.out_qss_path}")
         qss = self._rebuild_qss()
         write_file(self.out_qss_path, qss)
+
+        # setStyleSheet re-polishes every widget, so skip it when nothing changed
+        if qss == self._last_qss:
+            return
+        self._last_qss = qss
         self.app.setStyleSheet(qss)
 
     def _rebuild_qss(self) -> str: